@@ -5,8 +5,11 @@ import pandas as pd
 from rex import Outputs
 
 
+SITES_PER_WORKER = 1000
+
+
 def run_model(lat, lon, a, b, c):
-    """Example model that runs computation for a single site."""
+    """Example model that runs computation for arrays of sites."""
 
     # simple computation for example purposes
     x = lat + lon
@@ -16,14 +19,13 @@ def run_model(lat, lon, a, b, c):
 def run(project_points, a, b, c, tag):
     """Run model on a single node."""
 
-    data = []
-    for site in project_points:
-        data.append(run_model(site.lat, site.lon, a, b, c))
+    lats, lons = project_points.arrays("lat", "lon")
+    data = run_model(lats, lons, a, b, c).astype("float32")
 
     out_fp = f"results{tag}.h5"
     with Outputs(out_fp, "w") as fh:
         fh.meta = project_points.df
-        fh.write_dataset("outputs", data=np.array(data), dtype="float32")
+        fh.write_dataset("outputs", data=data, dtype="float32")
 
     return out_fp
 
@@ -42,17 +44,20 @@ def run_parallelized(project_points, a, b, c, tag, max_workers=None):
         meta=project_points.df,
     )
 
+    data = np.empty(len(project_points), dtype="float32")
+    lats, lons = project_points.arrays("lat", "lon")
     futures = {}
     with ProcessPoolExecutor(max_workers=max_workers) as exe:
-        for site in project_points:
-            future = exe.submit(run_model, site.lat, site.lon, a, b, c)
-            futures[future] = site.gid
+        for start in range(0, len(project_points), SITES_PER_WORKER):
+            chunk = slice(start, start + SITES_PER_WORKER)
+            future = exe.submit(run_model, lats[chunk], lons[chunk], a, b, c)
+            futures[future] = chunk
 
-    with Outputs(out_fp, "a") as out:
         for future in as_completed(futures):
-            gid = futures.pop(future)
-            ind = project_points.index(gid)
-            out["outputs", ind] = future.result()
+            data[futures.pop(future)] = future.result()
+
+    with Outputs(out_fp, "a") as out:
+        out["outputs"] = data
 
     return out_fp
 
@@ -4,22 +4,23 @@
 Based on reV-batch.
 """
 import os
-import copy
+import re
 import json
 import shutil
+import filecmp
 import logging
 from warnings import warn
 from pathlib import Path
 from itertools import product
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
-from rex.utilities import parse_year
-
 from gaps.config import load_config, ConfigType, resolve_all_paths
 import gaps.cli.pipeline
 from gaps.pipeline import Pipeline
+from gaps.utilities import working_directory
 from gaps.exceptions import (
     gapsValueError,
     gapsConfigError,
@@ -31,6 +32,9 @@ from gaps.warnings import gapsWarning
 logger = logging.getLogger(__name__)
 
 BATCH_CSV_FN = "batch_jobs.csv"
+MAX_COPY_WORKERS = 32
+# same pattern as `rex.utilities.parse_year`, compiled once
+_YEAR_REGEX = re.compile(r".*[^0-9]([1-2][0-9]{3})($|[^0-9])")
 BatchSet = namedtuple("BatchSet", ["arg_combo", "file_set", "tag"])
 
 
@@ -64,14 +68,13 @@ class BatchJob:
     def job_table(self):
         """pd.DataFrame: Batch job summary table."""
         jobs = []
-        for job_tag, (arg_comb, file_set, set_tag) in self._sets.items():
+        for arg_comb, file_set, set_tag in self._sets.values():
             job_info = {k: str(v) for k, v in arg_comb.items()}
             job_info["set_tag"] = str(set_tag)
             job_info["files"] = str(file_set)
-            job_info = pd.DataFrame(job_info, index=[job_tag])
             jobs.append(job_info)
 
-        table = pd.concat(jobs)
+        table = pd.DataFrame(jobs, index=list(self._sets))
 
         table.index.name = "job"
         table["pipeline_config"] = self._pipeline_fp.as_posix()
@@ -94,41 +97,20 @@ class BatchJob:
         logger.debug("Using the following batch sets: %s", self._sets)
         logger.info("Preparing batch job directories...")
 
-        # walk through current directory getting everything to copy
-        for source_dir, _, filenames in os.walk(self._base_dir):
-            logger.debug("Processing files in : %s", source_dir)
-            logger.debug(
-                "    - Is dupe dir: %s",
-                any(job_tag in source_dir for job_tag in self._sets),
-            )
-
-            # don't make additional copies of job sub directories.
-            if any(job_tag in source_dir for job_tag in self._sets):
-                continue
-
-            # For each dir level, iterate through the batch arg combos
-            for tag, (arg_comb, mod_files, __) in self._sets.items():
-                mod_files = {Path(fp) for fp in mod_files}
-                # Add the job tag to the directory path.
-                # This will copy config subdirs into the job subdirs
-                source_dir = Path(source_dir)
-                destination_dir = (
-                    self._base_dir
-                    / tag
-                    / source_dir.relative_to(self._base_dir)
+        source_files = self._source_files_by_dir()
+        _run_tasks_concurrently(
+            [
+                (
+                    _make_job_dir,
+                    self._base_dir,
+                    self._base_dir / tag,
+                    source_files,
+                    arg_comb,
+                    mod_files,
                 )
-                logger.debug("Creating dir: %s", destination_dir)
-                destination_dir.mkdir(parents=True, exist_ok=True)
-
-                for name in filenames:
-                    if BATCH_CSV_FN in name:
-                        continue
-                    fp_source = source_dir / name
-                    fp_target = destination_dir / name
-                    if fp_source in mod_files:
-                        _mod_file(fp_source, fp_target, arg_comb)
-                    else:
-                        _copy_batch_file(fp_source, destination_dir / name)
+                for tag, (arg_comb, mod_files, __) in self._sets.items()
+            ]
+        )
 
         for tag in self._sets:
             destination_dir = self._base_dir / tag
@@ -144,27 +126,54 @@ class BatchJob:
 
         logger.info("Batch job directories ready for execution.")
 
+    def _source_files_by_dir(self):
+        """Map relative batch source dirs to the file names they contain."""
+        source_files = {}
+        job_tag_pattern = re.compile("|".join(map(re.escape, self._sets)))
+        # walk through current directory getting everything to copy
+        for source_dir, sub_dirs, filenames in os.walk(self._base_dir):
+            is_dupe_dir = bool(self._sets) and bool(
+                job_tag_pattern.search(source_dir)
+            )
+            logger.debug("Processing files in : %s", source_dir)
+            logger.debug("    - Is dupe dir: %s", is_dupe_dir)
+
+            # don't make additional copies of job sub directories.
+            if is_dupe_dir:
+                sub_dirs[:] = []
+                continue
+
+            # don't descend into existing job sub directories at all
+            sub_dirs[:] = [name for name in sub_dirs if name not in self._sets]
+
+            relative_dir = Path(source_dir).relative_to(self._base_dir)
+            source_files[relative_dir] = [
+                name for name in filenames if BATCH_CSV_FN not in name
+            ]
+
+        return source_files
+
     def _run_pipelines(self, monitor_background=False):
         """Run the pipeline modules for each batch job."""
 
         for sub_directory in self.sub_dirs:
-            os.chdir(sub_directory)
             pipeline_config = sub_directory / self._pipeline_fp.name
             if not pipeline_config.is_file():
                 raise gapsConfigError(
                     f"Could not find pipeline config to run: "
                     f"{pipeline_config!r}"
                 )
-            if monitor_background:
-                # pylint: disable=no-value-for-parameter
-                gaps.cli.pipeline.pipeline(
-                    pipeline_config,
-                    cancel=False,
-                    monitor=True,
-                    background=True,
-                )
-            else:
-                Pipeline.run(pipeline_config, monitor=False)
+            with working_directory(sub_directory):
+                if monitor_background:
+                    # pylint: disable=no-value-for-parameter
+                    gaps.cli.pipeline.pipeline(
+                        pipeline_config,
+                        cancel=False,
+                        monitor=True,
+                        background=True,
+                    )
+                else:
+                    Pipeline.run(pipeline_config, monitor=False)
 
     def cancel(self):
         """Cancel all pipeline modules for all batch jobs."""
@@ -228,11 +237,7 @@ class BatchJob:
         if dry_run:
             return
 
-        cwd = os.getcwd()
-        try:
-            self._run_pipelines(monitor_background=monitor_background)
-        finally:
-            os.chdir(cwd)
+        self._run_pipelines(monitor_background=monitor_background)
 
 
 def _load_batch_config(config_fp):
@@ -280,8 +285,7 @@ def _validate_batch_table(table):
 def _convert_batch_table_to_dict(table):
     """Convert validated batch csv file to dict."""
     sets = []
-    for _, job in table.iterrows():
-        job_dict = job.to_dict()
+    for job_dict in table.to_dict(orient="records"):
         args = {
             k: [v]
             for k, v in job_dict.items()
@@ -355,7 +359,11 @@ def _check_sets(config, base_dir):
 
 def _enumerated_product(args):
     """An enumerated product function."""
-    return list(zip(product(*(range(len(x)) for x in args)), product(*args)))
+    args = [list(x) for x in args]
+    return [
+        (inds, tuple(arg[ind] for arg, ind in zip(args, inds)))
+        for inds in product(*(range(len(x)) for x in args))
+    ]
 
 
 # pylint: disable=too-many-locals
@@ -398,13 +406,18 @@ def _parse_config(config):
             )
             warn(msg, gapsWarning)
 
+        arg_prefixes = {
+            k: "".join(s[0] for s in k.split("_"))
+            for k, v in args.items()
+            if len(v) > 1
+        }
         for inds, comb in products:
             arg_combo = dict(zip(args, comb))
             arg_inds = dict(zip(args, inds))
-            tag_arg_comb = {
-                k: v for k, v in arg_combo.items() if len(args[k]) > 1
-            }
-            job_tag = _make_job_tag(set_tag, tag_arg_comb, arg_inds)
+            tag_arg_comb = {k: arg_combo[k] for k in arg_prefixes}
+            job_tag = _make_job_tag(
+                set_tag, tag_arg_comb, arg_inds, arg_prefixes
+            )
             batch_sets[job_tag] = BatchSet(
                 arg_combo, batch_set["files"], set_tag
             )
@@ -412,20 +425,16 @@ def _parse_config(config):
     return batch_sets
 
 
-def _make_job_tag(set_tag, arg_comb, arg_inds):
+def _make_job_tag(set_tag, arg_comb, arg_inds, arg_prefixes):
     """Make a job tags from a unique combination of args + values."""
 
     job_tag = [set_tag] if set_tag else []
 
     for arg, value in arg_comb.items():
-        arg_tag = "".join(
-            [s[0] for s in arg.split("_")]
-            + (
-                [_format_value(value)]
-                if isinstance(value, (int, float))
-                else [str(arg_inds[arg])]
-            )
-        )
+        if isinstance(value, (int, float)):
+            arg_tag = arg_prefixes[arg] + _format_value(value)
+        else:
+            arg_tag = arg_prefixes[arg] + str(arg_inds[arg])
 
         job_tag.append(arg_tag)
 
@@ -437,7 +446,7 @@ def _format_value(value):
 
     value = str(value).replace(".", "")
 
-    if parse_year(f"_{value}", option="bool"):
+    if _YEAR_REGEX.match(f"_{value}"):
         value = f"{value}0"
 
     return value
@@ -449,26 +458,52 @@ def _mod_file(fpath_in, fpath_out, arg_mods):
         "Copying and modifying run file %r to job: %r", fpath_in, fpath_out
     )
     config_type = ConfigType(fpath_in.name.split(".")[-1])
-    config = config_type.load(fpath_in)
-    config_type.write(fpath_out, _mod_dict(config, arg_mods))
+    with open(fpath_in, "r") as config_file:
+        config_str = config_file.read()
+
+    if not _may_contain_keys(config_str, arg_mods):
+        logger.debug("No batch args found in %r; copying as-is", fpath_in)
+        shutil.copyfile(fpath_in, fpath_out)
+        return
+
+    config = config_type.loads(config_str)
+    arg_keys = frozenset(arg_mods)
+    config_type.write(fpath_out, _mod_dict(config, arg_mods, arg_keys))
+
+
+def _may_contain_keys(config_str, keys):
+    """Check if any of the keys may be in the (unparsed) config string.
+
+    Keys written with escape sequences cannot be ruled out by a
+    substring search, so any string containing escapes is assumed to
+    (potentially) contain the keys.
+    """
+    if "\\" in config_str:
+        return True
+    return any(str(key) in config_str for key in keys)
 
 
-def _mod_dict(inp, arg_mods):
-    """Recursively modify key/value pairs in a dictionary."""
+def _mod_dict(inp, arg_mods, arg_keys):
+    """Recursively modify key/value pairs in a dictionary.
 
-    out = copy.deepcopy(inp)
+    `arg_keys` is the (pre-computed) frozenset of `arg_mods` keys, used
+    for the membership test on every key in the traversal.
+    """
 
     if isinstance(inp, dict):
-        for key, val in inp.items():
-            if key in arg_mods:
-                out[key] = _clean_arg(arg_mods[key])
-            elif isinstance(val, (list, dict)):
-                out[key] = _mod_dict(val, arg_mods)
+        return {
+            key: (
+                _clean_arg(arg_mods[key])
+                if key in arg_keys
+                else _mod_dict(val, arg_mods, arg_keys)
+            )
+            for key, val in inp.items()
+        }
 
-    elif isinstance(inp, list):
-        return [_mod_dict(entry, arg_mods) for entry in inp]
+    if isinstance(inp, list):
+        return [_mod_dict(entry, arg_mods, arg_keys) for entry in inp]
 
-    return out
+    return inp
 
 
 def _clean_arg(arg):
@@ -485,11 +520,52 @@ def _clean_arg(arg):
     return arg
 
 
+def _run_tasks_concurrently(tasks):
+    """Execute (function, *args) tasks concurrently in threads."""
+    if not tasks:
+        return
+
+    max_workers = min(MAX_COPY_WORKERS, len(tasks))
+    with ThreadPoolExecutor(max_workers=max_workers) as exe:
+        futures = [exe.submit(*task) for task in tasks]
+        for future in futures:
+            future.result()
+
+
+def _make_job_dir(base_dir, job_dir, source_files, arg_comb, mod_files):
+    """Copy (and modify) all batch source files into a job directory."""
+    mod_files = {Path(fp) for fp in mod_files}
+    for relative_dir, filenames in source_files.items():
+        # Add the job tag to the directory path.
+        # This will copy config subdirs into the job subdirs
+        source_dir = base_dir / relative_dir
+        destination_dir = job_dir / relative_dir
+        logger.debug("Creating dir: %s", destination_dir)
+        destination_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in filenames:
+            fp_source = source_dir / name
+            fp_target = destination_dir / name
+            if fp_source in mod_files:
+                _mod_file(fp_source, fp_target, arg_comb)
+            else:
+                _copy_batch_file(fp_source, fp_target)
+
+
 def _copy_batch_file(fp_source, fp_target):
     """Copy a file in the batch directory into a job directory if needed."""
     if not _source_needs_copying(fp_source, fp_target):
         return
 
+    if _contents_match(fp_source, fp_target):
+        logger.debug(
+            "Run file %r already matches %r; skipping copy",
+            fp_source,
+            fp_target,
+        )
+        os.utime(fp_target)
+        return
+
     logger.debug("Copying run file %r to %r", fp_source, fp_target)
     shutil.copyfile(fp_source, fp_target)
 
@@ -501,11 +577,16 @@ def _source_needs_copying(fp_source, fp_target):
     return fp_source.lstat().st_mtime > fp_target.lstat().st_mtime
 
 
+def _contents_match(fp_source, fp_target):
+    """Determine if dest already has the exact same contents as source."""
+    try:
+        if os.stat(fp_source).st_size != os.stat(fp_target).st_size:
+            return False
+    except FileNotFoundError:
+        return False
+    return filecmp.cmp(fp_source, fp_target, shallow=False)
+
+
 def _json_load_with_cleaning(input_str):
-    return json.loads(
-        input_str.replace("'", '"')
-        .rstrip('"""')
-        .lstrip('"""')
-        .rstrip('"')
-        .lstrip('"')
-    )
+    """Load a JSON string after normalizing quotes."""
+    return json.loads(input_str.replace("'", '"').strip('"'))
@@ -2,7 +2,7 @@
 """
 Main CLI entry points.
 """
-from functools import partial
+from functools import partial, lru_cache
 
 import click
 
@@ -25,6 +25,18 @@ from gaps.cli.preprocessing import (
 )
 from gaps.cli.status import status_command
 
+_CONFIG_FILE_TYPE = click.Path(exists=True)
+_COMMAND_KWARGS = {
+    "context_settings": None,
+    "epilog": None,
+    "short_help": None,
+    "options_metavar": "[OPTIONS]",
+    "add_help_option": True,
+    "no_args_is_help": True,
+    "hidden": False,
+    "deprecated": False,
+}
+
 
 class _CLICommandGenerator:
     """Generate commands from a list of configurations."""
@@ -69,19 +81,23 @@ class _CLICommandGenerator:
 
     def convert_to_commands(self):
         """Convert all of the command configs into click commands."""
+        new_commands, new_templates = {}, {}
         for command_config in self.command_configs:
-            command = as_click_command(command_config)
-            self.commands.append(command)
-            Pipeline.COMMANDS[command_config.name] = command
+            name = command_config.name
+            new_commands[name] = as_click_command(command_config)
             template_config = command_config.documentation.template_config
-            self.template_configs[command_config.name] = template_config
+            new_templates[name] = template_config
+
+        self.commands.extend(new_commands.values())
+        Pipeline.COMMANDS.update(new_commands)
+        self.template_configs.update(new_templates)
         return self
 
     def add_pipeline_command(self):
         """Add pipeline command, which includes the previous commands."""
         tpc = template_pipeline_config(self.command_configs)
         pipeline = pipeline_command(tpc)
-        self.commands = [pipeline] + self.commands
+        self.commands.insert(0, pipeline)
         self.template_configs["pipeline"] = tpc
         return self
 
@@ -107,22 +123,25 @@ class _CLICommandGenerator:
 
     def generate(self):
         """Generate a list of click commands from input configurations."""
-        return (
-            self.add_collect_command_configs()
-            .add_script_command()
-            .convert_to_commands()
-            .add_pipeline_command()
-            .add_batch_command()
-            .add_status_command()
-            .add_template_command()
-            .add_reset_command()
-            .commands
-        )
-
-
+        self.add_collect_command_configs()
+        self.add_script_command()
+        self.convert_to_commands()
+        self.add_pipeline_command()
+        self.add_batch_command()
+        self.add_status_command()
+        self.add_template_command()
+        self.add_reset_command()
+        return self.commands
+
+
+@lru_cache(maxsize=256)
 def as_click_command(command_config):
     """Convert a GAPs command configuration object into a ``click`` command.
 
+    Results are cached on the identity of the command configuration
+    object, so repeated calls with the same configuration return the
+    same ``click`` command.
+
     Parameters
     ----------
     command_config : command configuration object
@@ -142,27 +161,20 @@ def as_click_command(command_config):
         click.Option(
             param_decls=["--config_file", "-c"],
             required=True,
-            type=click.Path(exists=True),
+            type=_CONFIG_FILE_TYPE,
             help=doc.config_help(name),
         )
     ]
 
     return _WrappedCommand(
         name,
-        context_settings=None,
         callback=partial(
             from_config,
             command_config=command_config,
         ),
         params=params,
         help=doc.command_help(name),
-        epilog=None,
-        short_help=None,
-        options_metavar="[OPTIONS]",
-        add_help_option=True,
-        no_args_is_help=True,
-        hidden=False,
-        deprecated=False,
+        **_COMMAND_KWARGS,
     )
 
 
@@ -2,7 +2,6 @@
 """
 GAPs collection CLI entry points.
 """
-import glob
 import logging
 from warnings import warn
 
@@ -59,6 +58,12 @@ def collect(
     -------
     str
         Path to HDF5 file with the collected outputs.
+
+    Raises
+    ------
+    gapsFileNotFoundError
+        If no files other than the output file match the collection
+        pattern.
     """
     if "*" not in _pattern:
         logger.info("Collect pattern has no wildcard! No collection performed")
@@ -71,8 +76,8 @@ def collect(
         _out_path,
     )
 
-    datasets = _find_datasets(datasets, _pattern)
     collector = Collector(_out_path, _pattern, project_points, clobber=clobber)
+    datasets = _find_datasets(datasets, collector.h5_files[0])
     for dataset_name in datasets:
         logger.debug("Collecting %r...", dataset_name)
         collector.collect(dataset_name)
@@ -85,23 +90,28 @@ def collect(
     return str(_out_path)
 
 
-def _find_datasets(datasets, pattern):
+def _find_datasets(datasets, sample_file):
     """Find datasets from a sample file."""
-
-    with Resource(glob.glob(pattern)[0]) as res:
-        if datasets is None:
-            return [
-                d
-                for d in res
-                if not d.startswith("time_index") and d != "meta"
-            ]
-        missing = {d for d in datasets if d not in res}
-
-    if any(missing):
+    with Resource(sample_file) as res:
+        available = list(res)
+
+    if datasets is None:
+        return [
+            d
+            for d in available
+            if not d.startswith("time_index") and d != "meta"
+        ]
+
+    available = frozenset(available)
+    keep, missing = [], []
+    for dataset in dict.fromkeys(datasets):
+        (keep if dataset in available else missing).append(dataset)
+
+    if missing:
         msg = (
             f"Could not find the following datasets in the output files: "
             f"{missing}. Skipping..."
         )
         warn(msg, gapsWarning)
 
-    return list(set(datasets) - missing)
+    return keep
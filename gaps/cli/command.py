@@ -3,9 +3,11 @@
 """
 GAPs command configuration preprocessing functions.
 """
+import re
 from abc import ABC, abstractmethod
-from functools import cached_property, wraps
+from functools import cached_property, lru_cache
 from inspect import signature
+from warnings import warn
 
 import click
 
@@ -13,13 +15,28 @@ from gaps.cli.config import GAPS_SUPPLIED_ARGS
 from gaps.cli.documentation import CommandDocumentation
 from gaps.cli.preprocessing import split_project_points_into_ranges
 from gaps.utilities import _is_sphinx_build
+from gaps.warnings import gapsDeprecationWarning
+
+_POINTS_KEYS = frozenset({"project_points"})
+_SPLIT_RANGE_KEYS = frozenset({"project_points_split_range"})
+_SPATIAL_KEYS = _POINTS_KEYS | _SPLIT_RANGE_KEYS
+_WRAP_TEXT_SUBS = {
+    "::\n\n": ":\n\n",
+    "::\n": ":\n\n",
+    "\n\n": "\n",
+    "[required]": "\n[required]",
+}
+_WRAP_TEXT_RE = re.compile("|".join(map(re.escape, _WRAP_TEXT_SUBS)))
+_PARAMS_HEADER_RE = re.compile(r"Parameters *\n *-{10}")
+_CLICK_WRAP_TEXT = click.formatting.wrap_text
 
 
 class AbstractBaseCLICommandConfiguration(ABC):
     """Abstract Base CLI Command representation.
 
-    This base implementation provides helper methods to determine wether
-    a given command is split spatially.
+    This base implementation determines wether a given command is split
+    spatially (exposed as the ``is_split_spatially`` attribute, which is
+    ``True`` if execution is split spatially across nodes).
 
     Note that ``runner`` is a required part of the interface but is not
     listed as an abstract property to avoid unnecessary function
@@ -36,34 +53,37 @@ class AbstractBaseCLICommandConfiguration(ABC):
     ):
         self.name = name
         self.add_collect = add_collect
-        self.split_keys = set() if split_keys is None else set(split_keys)
+        self.split_keys = frozenset(split_keys or ())
         self.config_preprocessor = config_preprocessor or _passthrough
-        self.skip_doc_params = (
-            set() if skip_doc_params is None else set(skip_doc_params)
+        self._base_preprocessor = self.config_preprocessor
+        self.skip_doc_params = frozenset(skip_doc_params or ())
+        self._doc_skip_params = self.skip_doc_params | GAPS_SUPPLIED_ARGS
+        self.is_split_spatially = not _SPATIAL_KEYS.isdisjoint(
+            self.split_keys
         )
-        preprocessor_sig = signature(self.config_preprocessor)
-        self.preprocessor_args = preprocessor_sig.parameters.keys()
-        self.preprocessor_defaults = {
-            name: param.default
-            for name, param in preprocessor_sig.parameters.items()
-            if param.default != param.empty
-        }
         if self.is_split_spatially:
             self._add_split_on_points()
 
     def _add_split_on_points(self):
         """Add split points preprocessing."""
         self.config_preprocessor = _split_points(self.config_preprocessor)
-        self.split_keys -= {"project_points"}
-        self.split_keys |= {"project_points_split_range"}
+        # execution is split on the point ranges, not the points input
+        self.split_keys = (self.split_keys - _POINTS_KEYS) | _SPLIT_RANGE_KEYS
 
-    @property
-    def is_split_spatially(self):
-        """bool: ``True`` if execution is split spatially across nodes."""
-        return any(
-            key in self.split_keys
-            for key in ["project_points", "project_points_split_range"]
-        )
+    @cached_property
+    def sorted_split_keys(self):
+        """tuple: Split keys in job order (point ranges always last)."""
+        return tuple(sorted(self.split_keys, key=_project_points_last))
+
+    @cached_property
+    def preprocessor_args(self):
+        """frozenset: Names of the config preprocessor parameters."""
+        return _signature_info(self._base_preprocessor)[0]
+
+    @cached_property
+    def preprocessor_defaults(self):
+        """dict: Default values for the config preprocessor parameters."""
+        return dict(_signature_info(self._base_preprocessor)[1])
 
     @property
     @abstractmethod
@@ -331,7 +351,7 @@ class CLICommandFromFunction(AbstractBaseCLICommandConfiguration):
             ``None``.
         """
         super().__init__(
-            name or function.__name__.strip("_").replace("_", "-"),
+            name or _click_name(function.__name__),
             add_collect,
             split_keys,
             config_preprocessor,
@@ -342,15 +362,15 @@ class CLICommandFromFunction(AbstractBaseCLICommandConfiguration):
     @cached_property
     def documentation(self):
         """CommandDocumentation: Documentation object."""
-        return CommandDocumentation(
+        return _command_documentation(
             self.runner,
-            self.config_preprocessor,
-            skip_params=GAPS_SUPPLIED_ARGS | self.skip_doc_params,
+            self._base_preprocessor,
+            skip_params=self._doc_skip_params,
             is_split_spatially=self.is_split_spatially,
         )
 
 
-# pylint: disable=invalid-name,import-outside-toplevel
+# pylint: disable=invalid-name
 def CLICommandConfiguration(
     name, function, split_keys=None, config_preprocessor=None
 ):  # pragma: no cover
@@ -358,9 +378,6 @@ def CLICommandConfiguration(
 
     Please use :class:`CLICommandFromFunction`
     """
-    from warnings import warn
-    from gaps.warnings import gapsDeprecationWarning
-
     warn(
         "The `CLICommandConfiguration` class is deprecated! Please use "
         "`CLICommandFromFunction` instead.",
@@ -369,10 +386,7 @@ def CLICommandConfiguration(
     return CLICommandFromFunction(
         function,
         name=name,
-        add_collect=any(
-            key in split_keys
-            for key in ["project_points", "project_points_split_range"]
-        ),
+        add_collect=not _SPATIAL_KEYS.isdisjoint(split_keys or ()),
         split_keys=split_keys,
         config_preprocessor=config_preprocessor,
     )
@@ -645,7 +659,7 @@ class CLICommandFromClass(AbstractBaseCLICommandConfiguration):
             ``None``.
         """
         super().__init__(
-            name or method.strip("_").replace("_", "-"),
+            name or _click_name(method),
             add_collect,
             split_keys,
             config_preprocessor,
@@ -662,32 +676,108 @@ class CLICommandFromClass(AbstractBaseCLICommandConfiguration):
     @cached_property
     def documentation(self):
         """CommandDocumentation: Documentation object."""
-        return CommandDocumentation(
+        return _command_documentation(
             self.runner,
             getattr(self.runner, self.run_method),
-            self.config_preprocessor,
-            skip_params=GAPS_SUPPLIED_ARGS | self.skip_doc_params,
+            self._base_preprocessor,
+            skip_params=self._doc_skip_params,
             is_split_spatially=self.is_split_spatially,
         )
 
 
+def _command_documentation(*functions, skip_params, is_split_spatially):
+    """Documentation for a set of functions (cached when hashable)."""
+    kwargs = {
+        "skip_params": skip_params,
+        "is_split_spatially": is_split_spatially,
+    }
+    try:
+        return _cached_command_documentation(*functions, **kwargs)
+    except TypeError:  # unhashable callable, e.g. a dataclass instance
+        return _cached_command_documentation.__wrapped__(*functions, **kwargs)
+
+
+@lru_cache(maxsize=256)
+def _cached_command_documentation(
+    *functions, skip_params, is_split_spatially
+):
+    """Build (and cache) the documentation for a set of functions.
+
+    Commands configured with the same functions and options share a
+    single :class:`CommandDocumentation` instance, so the docstrings
+    are only parsed once.
+    """
+    return CommandDocumentation(
+        *functions,
+        skip_params=skip_params,
+        is_split_spatially=is_split_spatially,
+    )
+
+
+@lru_cache(maxsize=None)
+def _click_name(name):
+    """Format a function or method name as a ``click``-style command."""
+    return name.strip("_").replace("_", "-")
+
+
+def _project_points_last(key):
+    """Sorting function that always puts "project_points_split_range" last."""
+    if isinstance(key, str):
+        if key.casefold() == "project_points_split_range":
+            return (chr(0x10FFFF),)  # PEP 393
+        return (key,)
+    return key
+
+
 def _passthrough(config):
     """Pass the input config through with no modifications."""
     return config
 
 
+def _signature_info(func):
+    """Parameter names and (name, default) pairs of a function."""
+    try:
+        return _cached_signature_info(func)
+    except TypeError:  # unhashable callable, e.g. a dataclass instance
+        return _cached_signature_info.__wrapped__(func)
+
+
+@lru_cache(maxsize=None)
+def _cached_signature_info(func):
+    """Parameter names and (name, default) pairs of a function (cached)."""
+    parameters = signature(func).parameters
+    defaults = tuple(
+        (name, param.default)
+        for name, param in parameters.items()
+        if param.default is not param.empty
+    )
+    return frozenset(parameters), defaults
+
+
 def _split_points(config_preprocessor):
     """Add the `split_project_points_into_ranges` to preprocessing."""
+    if config_preprocessor is _passthrough:
+        return _split_points_only
 
-    @wraps(config_preprocessor)
     def _config_preprocessor(config, *args, **kwargs):
         config = config_preprocessor(config, *args, **kwargs)
-        config = split_project_points_into_ranges(config)
-        return config
+        return split_project_points_into_ranges(config)
 
+    # `__wrapped__` lets `inspect.signature` see the original parameters
+    # and `__doc__` feeds the command documentation
+    _config_preprocessor.__wrapped__ = config_preprocessor
+    _config_preprocessor.__name__ = getattr(
+        config_preprocessor, "__name__", _config_preprocessor.__name__
+    )
+    _config_preprocessor.__doc__ = config_preprocessor.__doc__
     return _config_preprocessor
 
 
+def _split_points_only(config):
+    """Split project points into ranges with no other preprocessing."""
+    return split_project_points_into_ranges(config)
+
+
 # pylint: disable=invalid-name,unused-argument
 class _WrappedCommand(click.Command):
     """Click Command class with an updated `get_help` function.
@@ -697,45 +787,51 @@ class _WrappedCommand(click.Command):
     https://stackoverflow.com/questions/55585564/python-click-formatting-help-text
     """
 
-    _WRAP_TEXT_REPLACED = False
-
     def get_help(self, ctx):
-        """Format the help into a string and return it."""
-        if self._WRAP_TEXT_REPLACED:
-            return super().get_help(ctx)
-
-        orig_wrap_test = click.formatting.wrap_text
-
-        def wrap_text(
-            text,
-            width=78,
-            initial_indent="",
-            subsequent_indent="",
-            preserve_paragraphs=False,
-        ):
-            """Wrap text with gaps-style newline handling."""
-            wrapped_text = orig_wrap_test(
-                text.replace("\n", "\n\n"),
-                width,
-                initial_indent=initial_indent,
-                subsequent_indent=subsequent_indent,
-                preserve_paragraphs=True,
-            )
-            wrapped_text = (
-                wrapped_text.replace("\n\n", "\n").replace("::\n", ":\n\n")
-                # .replace("}\nParameters", "}\n\nParameters")
-                .replace("[required]", "\n[required]")
-            )
-            if "Parameters\n----------" not in wrapped_text.replace(" ", ""):
-                wrapped_text = wrapped_text.replace(".\n", ".\n\n")
-            elif not _is_sphinx_build():  # pragma: no cover
-                wrapped_text = wrapped_text.replace(
-                    "Parameters\n----------",
-                    "\nConfig Parameters\n-----------------",
-                )
-
-            return wrapped_text
-
-        click.formatting.wrap_text = wrap_text
-        self._WRAP_TEXT_REPLACED = True
+        """Format the help into a string and return it.
+
+        Only the wrapped docstring text is cached (see
+        `_wrap_text_cached`); the final help is formatted on every call
+        so that it reflects all of the context settings.
+        """
+        click.formatting.wrap_text = _gaps_wrap_text
         return super().get_help(ctx)
+
+
+def _gaps_wrap_text(
+    text,
+    width=78,
+    initial_indent="",
+    subsequent_indent="",
+    preserve_paragraphs=False,
+):
+    """Wrap text with gaps-style newline handling."""
+    return _wrap_text_cached(
+        text, width, initial_indent, subsequent_indent, _is_sphinx_build()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _wrap_text_cached(
+    text, width, initial_indent, subsequent_indent, is_sphinx_build
+):
+    """Cached implementation of `_gaps_wrap_text`."""
+    wrapped_text = _CLICK_WRAP_TEXT(
+        text.replace("\n", "\n\n"),
+        width,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+        preserve_paragraphs=True,
+    )
+    wrapped_text = _WRAP_TEXT_RE.sub(
+        lambda match: _WRAP_TEXT_SUBS[match.group()], wrapped_text
+    )
+    if _PARAMS_HEADER_RE.search(wrapped_text) is None:
+        wrapped_text = wrapped_text.replace(".\n", ".\n\n")
+    elif not is_sphinx_build:  # pragma: no cover
+        wrapped_text = wrapped_text.replace(
+            "Parameters\n----------",
+            "\nConfig Parameters\n-----------------",
+        )
+
+    return wrapped_text
@@ -2,12 +2,14 @@
 """
 GAPs CLI command for spatially distributed function runs.
 """
+import re
 import json
 import logging
-from copy import deepcopy
+from functools import cached_property
 from warnings import warn
 from pathlib import Path
 from itertools import product
+from math import prod
 from inspect import signature, isclass
 
 import click
@@ -34,24 +36,29 @@ _CMD_LIST = [
     "   {exclude_from_status}"
     ")",
 ]
+_CMD_TEMPLATE = "; ".join(_CMD_LIST)
 TAG = "_j"
+_JSON_TO_PY_LITERALS = {"null": "None", "true": "True", "false": "False"}
+_JSON_LITERAL_RE = re.compile(r'("(?:[^"\\]|\\.)*")|\b(null|true|false)\b')
 MAX_AU_BEFORE_WARNING = {
     "eagle": 10_000,
     "kestrel": 35_000,
 }
-GAPS_SUPPLIED_ARGS = {
-    "tag",
-    "command_name",
-    "pipeline_step",
-    "config_file",
-    "project_dir",
-    "job_name",
-    "out_dir",
-    "out_fpath",
-    "config",
-    "log_directory",
-    "verbose",
-}
+GAPS_SUPPLIED_ARGS = frozenset(
+    {
+        "tag",
+        "command_name",
+        "pipeline_step",
+        "config_file",
+        "project_dir",
+        "job_name",
+        "out_dir",
+        "out_fpath",
+        "config",
+        "log_directory",
+        "verbose",
+    }
+)
 
 
 class _FromConfig:
@@ -89,12 +96,12 @@ class _FromConfig:
             and self.config.get("execution_control", {}).get("nodes", 1) > 1
         )
 
-    @property
+    @cached_property
     def project_dir(self):
         """`Path`: Path to project directory."""
         return self.config_file.parent
 
-    @property
+    @cached_property
     def command_name(self):
         """str: Name of command being run."""
         return self.command_config.name
@@ -104,7 +111,7 @@ class _FromConfig:
         """str: Name of pipeline_step being run."""
         return self.ctx.obj.get("PIPELINE_STEP", self.command_name)
 
-    @property
+    @cached_property
     def job_name(self):
         """str: Name of job being run."""
         return "_".join(
@@ -137,7 +144,7 @@ class _FromConfig:
     def preprocess_config(self):
         """Apply preprocessing function to config file."""
 
-        preprocessor_kwargs = {
+        gaps_kwargs = {
             "config": self.config,
             "command_name": self.command_name,
             "pipeline_step": self.pipeline_step,
@@ -149,23 +156,16 @@ class _FromConfig:
             "log_directory": self.log_directory,
             "verbose": self.verbose,
         }
-        extra_preprocessor_kwargs = {
-            k: self.config[k]
-            for k in self.command_config.preprocessor_args
-            if k not in preprocessor_kwargs and k in self.config
-        }
-        preprocessor_kwargs.update(extra_preprocessor_kwargs)
-        preprocessor_defaults = {
-            k: v
-            for k, v in self.command_config.preprocessor_defaults.items()
-            if k not in preprocessor_kwargs
-        }
-        preprocessor_kwargs.update(preprocessor_defaults)
-        preprocessor_kwargs = {
-            k: v
-            for k, v in preprocessor_kwargs.items()
-            if k in self.command_config.preprocessor_args
-        }
+        preprocessor_defaults = self.command_config.preprocessor_defaults
+
+        # priority: gaps-supplied inputs > user config > function defaults
+        preprocessor_kwargs = {}
+        for name in self.command_config.preprocessor_args:
+            for source in (gaps_kwargs, self.config, preprocessor_defaults):
+                if name in source:
+                    preprocessor_kwargs[name] = source[name]
+                    break
+
         self.config = self.command_config.config_preprocessor(
             **preprocessor_kwargs
         )
@@ -210,14 +210,12 @@ class _FromConfig:
 
     def set_exclude_from_status(self):
         """Assemble the exclusion keyword set."""
-        self.exclude_from_status = {"project_points"}
-        self.exclude_from_status |= set(
+        exclude_from_status = {"project_points"}
+        exclude_from_status |= set(
             self.config.pop("exclude_from_status", set())
         )
         self.exclude_from_status = [
-            key.lower()
-            for key in self.exclude_from_status
-            if key.lower() != "tag"
+            key for key in map(str.lower, exclude_from_status) if key != "tag"
         ]
         return self
 
@@ -243,13 +241,21 @@ class _FromConfig:
         """Kickoff jobs across nodes based on config and run function."""
         keys_to_run, lists_to_run = self._keys_and_lists_to_run()
 
-        jobs = sorted(product(*lists_to_run))
-        self._warn_about_excessive_au_usage(len(jobs))
+        # the product of sorted lists is already in sorted order, so jobs
+        # can be streamed instead of materialized and sorted up front
+        lists_to_run = [sorted(values) for values in lists_to_run]
+        num_jobs = prod(map(len, lists_to_run))
+        self._warn_about_excessive_au_usage(num_jobs)
         extra_exec_args = self._extract_extra_exec_args_for_command()
+        base_config = self._base_node_config()
+        cmd_template = self._run_command_template()
 
-        for tag, values, exec_kwargs in self._with_tagged_context(jobs):
+        jobs = product(*lists_to_run)
+        for tag, values, exec_kwargs in self._with_tagged_context(
+            jobs, num_jobs
+        ):
 
-            node_specific_config = self._compile_node_config(tag)
+            node_specific_config = self._compile_node_config(base_config, tag)
             node_specific_config.update(extra_exec_args)
 
             for key, val in zip(keys_to_run, values):
@@ -258,60 +264,87 @@ class _FromConfig:
                 else:
                     node_specific_config.update(dict(zip(key, val)))
 
-            cmd = self._compile_run_command(node_specific_config)
+            cmd = self._compile_run_command(cmd_template, node_specific_config)
             kickoff_job(self.ctx, cmd, exec_kwargs)
 
         return self
 
-    def _with_tagged_context(self, jobs):
+    def _with_tagged_context(self, jobs, num_jobs_submit):
         """Iterate over jobs and populate context with job name."""
-        num_jobs_submit = len(jobs)
-
-        exec_kwargs = deepcopy(self.exec_kwargs)
+        exec_kwargs = dict(self.exec_kwargs)
         num_test_nodes = exec_kwargs.pop("num_test_nodes", None)
         if num_test_nodes is None:
             num_test_nodes = float("inf")
 
+        use_tag = num_jobs_submit > 1
+        n_zfill = len(str(max(0, num_jobs_submit - 1)))
+        tag_fmt = f"{TAG}{{:0{n_zfill}d}}".format
         for node_index, values in enumerate(jobs):
             if node_index >= num_test_nodes:
                 return
 
-            tag = _tag(node_index, num_jobs_submit)
+            tag = tag_fmt(node_index) if use_tag else ""
             self.ctx.obj["NAME"] = f"{self.job_name}{tag}"
             yield tag, values, exec_kwargs
 
-    def _compile_node_config(self, tag):
-        """Compile initial node-specific config."""
-        job_name = self.ctx.obj["NAME"]
-        node_specific_config = deepcopy(self.config)
-        node_specific_config.pop("execution_control", None)
-        node_specific_config.update(
+    def _base_node_config(self):
+        """Config shared by all nodes (node-specific values left unset)."""
+        base_config = {
+            k: v for k, v in self.config.items() if k != "execution_control"
+        }
+        project_dir = self.project_dir.as_posix()
+        base_config.update(
             {
-                "tag": tag,
+                "tag": None,
                 "command_name": self.command_name,
                 "pipeline_step": self.pipeline_step,
                 "config_file": self.config_file.as_posix(),
-                "project_dir": self.project_dir.as_posix(),
-                "job_name": job_name,
-                "out_dir": self.project_dir.as_posix(),
-                "out_fpath": self._suggested_stem(job_name).as_posix(),
+                "project_dir": project_dir,
+                "job_name": None,
+                "out_dir": project_dir,
+                "out_fpath": None,
                 "run_method": getattr(self.command_config, "run_method", None),
             }
         )
+        return base_config
+
+    def _compile_node_config(self, base_config, tag):
+        """Compile initial node-specific config.
+
+        Node configs only ever overwrite top-level keys before being
+        serialized, so a shallow copy of the shared base config is
+        sufficient (nested values are never mutated).
+        """
+        job_name = self.ctx.obj["NAME"]
+        node_specific_config = dict(base_config)
+        node_specific_config["tag"] = tag
+        node_specific_config["job_name"] = job_name
+        node_specific_config["out_fpath"] = self._suggested_stem(
+            job_name
+        ).as_posix()
         return node_specific_config
 
-    def _compile_run_command(self, node_specific_config):
+    def _run_command_template(self):
+        """Run command with only the node-specific fields left to fill."""
+        invariants = {
+            "run_func_module": self.command_config.runner.__module__,
+            "run_func_name": self.command_config.runner.__name__,
+            "project_dir": self.project_dir.as_posix(),
+            "logging_options": as_script_str(self.logging_options),
+            "exclude_from_status": as_script_str(self.exclude_from_status),
+            "pipeline_step": self.pipeline_step,
+        }
+        return _CMD_TEMPLATE.format(
+            node_specific_config="{node_specific_config}",
+            job_name="{job_name}",
+            **{key: _escape_braces(val) for key, val in invariants.items()},
+        )
+
+    def _compile_run_command(self, cmd_template, node_specific_config):
         """Create run command from config and job name."""
-        job_name = self.ctx.obj["NAME"]
-        cmd = "; ".join(_CMD_LIST).format(
-            run_func_module=self.command_config.runner.__module__,
-            run_func_name=self.command_config.runner.__name__,
+        cmd = cmd_template.format(
             node_specific_config=as_script_str(node_specific_config),
-            project_dir=self.project_dir.as_posix(),
-            logging_options=as_script_str(self.logging_options),
-            exclude_from_status=as_script_str(self.exclude_from_status),
-            pipeline_step=self.pipeline_step,
-            job_name=job_name,
+            job_name=self.ctx.obj["NAME"],
         )
         return f"python -c {cmd!r}"
 
@@ -334,8 +367,7 @@ class _FromConfig:
         """Compile run lists based on `command_config.split_keys` input."""
         keys_to_run = []
         lists_to_run = []
-        keys = sorted(self.command_config.split_keys, key=_project_points_last)
-        for key_group in keys:
+        for key_group in self.command_config.sorted_split_keys:
             keys_to_run.append(key_group)
             if isinstance(key_group, str):
                 lists_to_run.append(self.config.get(key_group) or [None])
@@ -355,13 +387,10 @@ class _FromConfig:
             return
 
         qos = self.exec_kwargs.get("qos") or str(QOSOption.UNSPECIFIED)
-        try:
-            qos_charge_factor = QOSOption(str(qos)).charge_factor
-        except ValueError:
-            qos_charge_factor = 1
+        qos_charge_factor = _qos_charge_factor(str(qos))
 
-        hardware = self.exec_kwargs.get("option", "local")
-        if hardware.casefold() == HardwareOption.SLURM:
+        hardware = self.exec_kwargs.get("option", "local").casefold()
+        if hardware == HardwareOption.SLURM:
             available_opts = [
                 f"{opt}"
                 for opt in HardwareOption
@@ -375,9 +404,8 @@ class _FromConfig:
             warn(msg, gapsWarning)
             return
 
-        try:
-            hardware_charge_factor = HardwareOption(hardware).charge_factor
-        except ValueError:
+        hardware_charge_factor = _hardware_charge_factor(hardware)
+        if hardware_charge_factor is None:
             return
 
         max_au_usage = int(
@@ -386,9 +414,7 @@ class _FromConfig:
             * qos_charge_factor
             * hardware_charge_factor
         )
-        max_au_thresh = MAX_AU_BEFORE_WARNING.get(
-            hardware.casefold(), float("inf")
-        )
+        max_au_thresh = MAX_AU_BEFORE_WARNING.get(hardware, float("inf"))
         if max_au_usage > max_au_thresh:
             msg = f"Job may use up to {max_au_usage:,} AUs!"
             warn(msg, gapsWarning)
@@ -429,13 +455,14 @@ def _validate_config(config, documentation):
 
 def _ensure_required_args_exist(config, documentation):
     """Make sure that args required for func to run exist in config."""
-    missing = {
-        name for name in documentation.required_args if name not in config
-    }
+    missing = documentation.required_config_keys.difference(config)
 
-    missing = _mark_extra_exec_params_missing_if_needed(
-        documentation, config, missing
-    )
+    exec_control = config.get("execution_control", {})
+    missing |= {
+        param
+        for param in documentation.required_exec_params
+        if param not in config and param not in exec_control
+    }
 
     if any(missing):
         msg = (
@@ -445,24 +472,9 @@ def _ensure_required_args_exist(config, documentation):
         raise gapsKeyError(msg)
 
 
-def _mark_extra_exec_params_missing_if_needed(documentation, config, missing):
-    """Add extra exec params as missing if not found in `execution_control."""
-    exec_control = config.get("execution_control", {})
-    for param in EXTRA_EXEC_PARAMS:
-        if documentation.param_required(param):
-            if param not in config and param not in exec_control:
-                missing |= {param}
-    return missing
-
-
 def _warn_about_extra_args(config, documentation):
     """Warn user about extra unused keys in the config file."""
-    extra = {
-        name
-        for name in config.keys()
-        if not _param_in_sig(name, documentation)
-    }
-    extra -= {"execution_control", "project_points_split_range"}
+    extra = config.keys() - documentation.allowed_config_keys
     if any(extra):
         msg = (
             "Found unused keys in the configuration file: %s. To silence "
@@ -472,38 +484,25 @@ def _warn_about_extra_args(config, documentation):
         warn(msg % extra, gapsWarning)
 
 
-def _param_in_sig(param, documentation):
-    """Determine if ``name`` is an argument in any func signatures"""
-    return any(
-        param in _public_args(signature)
-        for signature in documentation.signatures
-    )
-
-
-def _public_args(func_signature):
-    """Gather set of all "public" function args."""
-    return {
-        param
-        for param in func_signature.parameters.keys()
-        if not param.startswith("_")
-    }
+def _escape_braces(text):
+    """Escape braces so `text` survives a second `str.format` call."""
+    return text.replace("{", "{{").replace("}", "}}")
 
 
-def _project_points_last(key):
-    """Sorting function that always puts "project_points_split_range" last."""
-    if isinstance(key, str):
-        if key.casefold() == "project_points_split_range":
-            return (chr(0x10FFFF),)  # PEP 393
-        return (key,)
-    return key
+def _qos_charge_factor(qos):
+    """AU charge factor for a QOS option (``1`` if not recognized)."""
+    try:
+        return QOSOption(qos).charge_factor
+    except ValueError:
+        return 1
 
 
-def _tag(node_index, num_jobs):
-    """Determine node tag based on total number of jobs."""
-    n_zfill = len(str(max(0, num_jobs - 1)))
-    if num_jobs > 1:
-        return f"{TAG}{str(node_index).zfill(n_zfill)}"
-    return ""
+def _hardware_charge_factor(hardware):
+    """AU charge factor for a hardware option (``None`` if unknown)."""
+    try:
+        return HardwareOption(hardware).charge_factor
+    except ValueError:
+        return None
 
 
 def as_script_str(input_):
@@ -511,7 +510,8 @@ def as_script_str(input_):
 
     Essentially this means the input is dumped to json format with some
     minor replacements (e.g. null -> None, etc.). Importantly, all
-    string inputs are wrapped in double quotes.
+    string inputs are wrapped in double quotes, and their contents are
+    never modified by the replacements.
 
     Parameters
     ----------
@@ -532,12 +532,12 @@ def as_script_str(input_):
     ...                "e": [{"t": "hi"}]})
     {"a": None, "b": True, "c": False, "d": 3, "e": [{"t": "hi"}]}
     """
-    return (
-        json.dumps(input_)
-        .replace("null", "None")
-        .replace("false", "False")
-        .replace("true", "True")
-    )
+    return _JSON_LITERAL_RE.sub(_py_literal, json.dumps(input_))
+
+
+def _py_literal(match):
+    """Python replacement for a JSON literal (strings are kept as-is)."""
+    return match.group(1) or _JSON_TO_PY_LITERALS[match.group(2)]
 
 
 def run_with_status_updates(
@@ -643,10 +643,8 @@ def node_kwargs(run_func, config):
             split_range, config["project_points"]
         )
 
-    sig = signature(run_func)
-    run_kwargs = {
-        k: v for k, v in config.items() if k in sig.parameters.keys()
-    }
+    params = frozenset(signature(run_func).parameters)
+    run_kwargs = {k: v for k, v in config.items() if k in params}
     verb = "Initializing" if isclass(run_func) else "Running"
     logger.debug("%s %r with kwargs: %s", verb, run_func.__name__, run_kwargs)
     return run_kwargs
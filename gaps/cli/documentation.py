@@ -2,9 +2,8 @@
 """
 CLI documentation utilities.
 """
-from copy import deepcopy
 from itertools import chain
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from inspect import signature, isclass
 
 from numpydoc.docscrape import NumpyDocString
@@ -402,13 +401,9 @@ class CommandDocumentation:
             to the execution control block of the generated
             documentation. By default, `False`.
         """
-        self.signatures = [
-            signature(func) for func in _as_functions(functions)
-        ]
-        self.docs = [
-            NumpyDocString(func.__doc__ or "")
-            for func in _as_functions(functions)
-        ]
+        functions = list(_as_functions(functions))
+        self.signatures = [signature(func) for func in functions]
+        self.docs = [_parse_numpydoc(func.__doc__ or "") for func in functions]
         self.param_docs = {
             p.name: p for doc in self.docs for p in doc["Parameters"]
         }
@@ -419,7 +414,7 @@ class CommandDocumentation:
     @property
     def default_exec_values(self):
         """dict: Default "execution_control" config."""
-        exec_vals = deepcopy(DEFAULT_EXEC_VALUES)
+        exec_vals = DEFAULT_EXEC_VALUES.copy()
         if not self.is_split_spatially:
             exec_vals.pop("nodes", None)
         for param in EXTRA_EXEC_PARAMS:
@@ -431,7 +426,7 @@ class CommandDocumentation:
                 )
         return exec_vals
 
-    @property
+    @cached_property
     def exec_control_doc(self):
         """str: Execution_control documentation."""
         nodes_doc = NODES_DOC if self.is_split_spatially else ""
@@ -441,7 +436,7 @@ class CommandDocumentation:
             opts=hardware_options, n=nodes_doc, eep=self._extra_exec_param_doc
         )
 
-    @property
+    @cached_property
     def _extra_exec_param_doc(self):
         """str: Docstring formatted with the info from the input func."""
         return "".join(
@@ -492,6 +487,28 @@ class CommandDocumentation:
         }
         return required_args
 
+    @cached_property
+    def required_config_keys(self):
+        """frozenset: Top-level config keys required by the functions."""
+        return frozenset(self.required_args)
+
+    @cached_property
+    def required_exec_params(self):
+        """frozenset: Extra execution parameters required by the functions."""
+        return frozenset(
+            param for param in EXTRA_EXEC_PARAMS if self.param_required(param)
+        )
+
+    @cached_property
+    def allowed_config_keys(self):
+        """frozenset: All config keys that are used by the functions."""
+        public_args = {
+            name for name in self._parameters if not name.startswith("_")
+        }
+        return frozenset(
+            public_args | {"execution_control", "project_points_split_range"}
+        )
+
     @property
     def template_config(self):
         """dict: A template configuration file for this function."""
@@ -510,7 +527,7 @@ class CommandDocumentation:
         )
         return config
 
-    @property
+    @cached_property
     def _parameter_npd(self):
         """NumpyDocString: Parameter help `NumpyDocString` instance."""
         param_doc = NumpyDocString("")
@@ -521,24 +538,26 @@ class CommandDocumentation:
         ]
         return param_doc
 
-    @property
+    @cached_property
     def parameter_help(self):
         """str: Parameter help for the func."""
         return str(self._parameter_npd)
 
-    @property
+    @cached_property
     def hpc_parameter_help(self):
         """str: Parameter help for the func, including execution control."""
         exec_dict_param = [
             p
-            for p in NumpyDocString(self.exec_control_doc)["Parameters"]
+            for p in _parse_numpydoc(self.exec_control_doc)["Parameters"]
             if p.name in {"execution_control", "log_directory", "log_level"}
         ]
-        param_doc = deepcopy(self._parameter_npd)
-        param_doc["Parameters"] = exec_dict_param + param_doc["Parameters"]
+        param_doc = NumpyDocString("")
+        param_doc["Parameters"] = (
+            exec_dict_param + self._parameter_npd["Parameters"]
+        )
         return "\n".join(_format_lines(str(param_doc).split("\n")))
 
-    @property
+    @cached_property
     def extended_summary(self):
         """str: Function extended summary, with extra whitespace stripped."""
         return "\n".join(
@@ -598,21 +617,23 @@ class CommandDocumentation:
         doc = COMMAND_DOC.format(name=command_name, desc=self.extended_summary)
         return _cli_formatted(doc)
 
-    @lru_cache(maxsize=16)
+    @cached_property
+    def _parameters(self):
+        """dict: Parameter objects by name (first signature wins)."""
+        parameters = {}
+        for sig in self.signatures:
+            for name, param in sig.parameters.items():
+                parameters.setdefault(name, param)
+        return parameters
+
     def _param_value(self, param):
         """Extract parameter if it exists in signature"""
-        for sig in self.signatures:
-            for name in sig.parameters:
-                if name == param:
-                    return sig.parameters[param]
-        return None
+        return self._parameters.get(param)
 
-    @lru_cache(maxsize=16)
     def _param_in_func_signature(self, param):
         """`True` if `param` is a param of the input function."""
-        return self._param_value(param) is not None
+        return param in self._parameters
 
-    @lru_cache(maxsize=16)
     def param_required(self, param):
         """Check wether a parameter is a required input for the run function.
 
@@ -740,6 +761,16 @@ def _format_dict(sample, names, batch_docs=False):  # pragma: no cover
     return configs
 
 
+@lru_cache(maxsize=None)
+def _parse_numpydoc(docstring):
+    """Parse (and cache) a docstring.
+
+    The returned instance is shared between callers and must not be
+    modified.
+    """
+    return NumpyDocString(docstring)
+
+
 def _as_functions(functions):
     """Yield items from input, converting all classes to their init methods"""
     for func in functions:
@@ -2,10 +2,10 @@
 """
 GAPs script CLI function.
 """
-import os
 import logging
 
 from gaps.hpc import submit
+from gaps.utilities import working_directory
 
 
 logger = logging.getLogger(__name__)
@@ -27,13 +27,9 @@ def script(_cmd, project_dir):
     str
         Path to HDF5 file with the collected outputs.
     """
-    original_directory = os.getcwd()
-    try:
-        os.chdir(project_dir)
+    with working_directory(project_dir):
         stdout, stderr = submit(_cmd)
-        if stdout:
-            logger.info("Subprocess received stdout: \n%s", stdout)
-        if stderr:
-            logger.warning("Subprocess received stderr: \n%s", stderr)
-    finally:
-        os.chdir(original_directory)
+    if stdout:
+        logger.info("Subprocess received stdout: \n%s", stdout)
+    if stderr:
+        logger.warning("Subprocess received stderr: \n%s", stderr)
@@ -8,6 +8,7 @@ import shutil
 import logging
 from pathlib import Path
 from warnings import warn
+from functools import cached_property
 
 import numpy as np
 import psutil
@@ -16,7 +17,7 @@ import pandas as pd
 from rex import Resource, Outputs
 from gaps.log import log_versions
 from gaps.warnings import gapsCollectionWarning
-from gaps.exceptions import gapsRuntimeError
+from gaps.exceptions import gapsRuntimeError, gapsFileNotFoundError
 from gaps.utilities import project_points_from_container_or_slice
 
 logger = logging.getLogger(__name__)
@@ -87,10 +88,6 @@ class DatasetCollector:
         self._gids = gids
         self._pass_through = pass_through
         self._dataset_in = dataset_in
-        self._file_gid_map = {
-            fp: parse_meta(fp)["gid"].values.tolist()
-            for fp in self._source_files
-        }
         if dataset_out is None:
             dataset_out = dataset_in
         self._dataset_out = dataset_out
@@ -111,11 +108,21 @@ class DatasetCollector:
         """list: List of gids corresponding to all sites to be combined."""
         return self._gids
 
-    @property
+    @cached_property
     def duplicate_gids(self):
         """bool: `True` if there are duplicate gids being collected."""
         return len(self.gids) > len(set(self.gids))
 
+    @cached_property
+    def _file_gid_map(self):
+        """dict: Map of source filepaths to the gids they contain."""
+        # only needed to place duplicate gids, so the (potentially many)
+        # source meta reads are deferred until then
+        return {
+            fp: parse_meta(fp)["gid"].values.tolist()
+            for fp in self._source_files
+        }
+
     def _pre_collect(self):
         """Run a pre-collection check and get relevant dataset attrs.
 
@@ -436,6 +443,13 @@ class Collector:
         self._h5_files = find_h5_files(
             self.collect_pattern, ignore=self.h5_out.name
         )
+        if not self._h5_files:
+            msg = (
+                f"No files found matching collection pattern "
+                f"{self.collect_pattern!r}!"
+            )
+            raise gapsFileNotFoundError(msg)
+
         if project_points is not None:
             logger.debug("Parsing project points...")
             self._gids = parse_project_points(project_points)
@@ -166,6 +166,45 @@ class ProjectPoints:
         """list: Gids (resource file index values) of sites."""
         return self.df["gid"].values.tolist()
 
+    def arrays(self, *columns, dtype=None):
+        """Project points columns as aligned NumPy arrays.
+
+        This is a column-oriented alternative to iterating over the
+        project points site-by-site, useful for vectorized models.
+
+        Parameters
+        ----------
+        *columns : str
+            Names of the project points columns to extract. If no
+            column names are given, all columns are returned (in
+            DataFrame column order).
+        dtype : str | np.dtype, optional
+            Optional dtype to cast each array to. By default, ``None``,
+            which keeps the DataFrame dtypes.
+
+        Returns
+        -------
+        tuple
+            Tuple of NumPy arrays, one per requested column, each with
+            one value per site.
+
+        Raises
+        ------
+        gapsKeyError
+            If any of the requested columns are not in the project
+            points DataFrame.
+        """
+        columns = columns or tuple(self._df.columns)
+        missing = [col for col in columns if col not in self._df]
+        if missing:
+            msg = (
+                f"Requested column(s) {missing} not found in project points "
+                f"DataFrame. Available columns: {list(self._df.columns)}"
+            )
+            raise gapsKeyError(msg)
+
+        return tuple(self._df[col].to_numpy(dtype=dtype) for col in columns)
+
     @property
     def sites_as_slice(self):
         """list | slice: Sites in slice format or list if non-sequential."""
@@ -2,12 +2,14 @@
 """
 GAPs utilities.
 """
+import os
 import sys
 import copy
 import logging
 import collections
 from enum import Enum
 from pathlib import Path
+from contextlib import contextmanager
 
 from gaps.exceptions import gapsValueError
 
@@ -171,6 +173,31 @@ def resolve_path(path, base_dir):
     return path
 
 
+@contextmanager
+def working_directory(directory):
+    """Context manager to temporarily change the working directory.
+
+    The original working directory is restored on exit, even if an
+    error is raised within the context.
+
+    Parameters
+    ----------
+    directory : path-like
+        Directory to use as the working directory within the context.
+
+    Yields
+    ------
+    path-like
+        The input directory.
+    """
+    original_directory = os.getcwd()
+    try:
+        os.chdir(directory)
+        yield directory
+    finally:
+        os.chdir(original_directory)
+
+
 def _is_sphinx_build():
     """``True`` if sphinx is in system modules, else ``False``"""
     return "sphinx" in sys.modules
@@ -17,7 +17,7 @@ import numpy as np
 
 from gaps import Pipeline
 from gaps.status import Status, StatusOption
-from gaps.cli import CLICommandFromFunction, make_cli
+from gaps.cli import CLICommandFromFunction, make_cli, as_click_command
 from gaps.cli.config import TAG
 from gaps.cli.documentation import CommandDocumentation
 from gaps.cli.pipeline import _can_run_background
@@ -164,6 +164,22 @@ def test_make_cli():
     assert "$ test collect-run --help" not in main.help
 
 
+def test_as_click_command_is_cached():
+    """Test that `as_click_command` reuses commands for the same config."""
+
+    config = CLICommandFromFunction(
+        _copy_files, name="run", split_keys=["project_points"]
+    )
+    command = as_click_command(config)
+    assert command.name == "run"
+    assert as_click_command(config) is command
+
+    other_config = CLICommandFromFunction(
+        _copy_files, name="run", split_keys=["project_points"]
+    )
+    assert as_click_command(other_config) is not command
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("test_single_file", [True, False])
 def test_cli(
@@ -13,6 +13,7 @@ import pytest
 
 from gaps.cli.collect import collect
 from gaps.warnings import gapsWarning
+from gaps.exceptions import gapsFileNotFoundError
 
 
 @pytest.mark.parametrize(
@@ -119,5 +120,30 @@ def test_collect_other_inputs(
     assert np.allclose(profiles, cf_profiles)
 
 
+def test_collect_no_matching_files(tmp_path):
+    """Test collect call with a pattern that matches no files."""
+
+    out_file = tmp_path / "cf.h5"
+    pattern = (tmp_path / "dne_*.h5").as_posix()
+    with pytest.raises(gapsFileNotFoundError) as exc_info:
+        collect(out_file, pattern)
+
+    assert "No files found matching collection pattern" in str(exc_info)
+    assert not list(tmp_path.glob("*"))
+
+
+def test_collect_only_output_file_matches(tmp_path):
+    """Test collect call with a pattern that only matches the output."""
+
+    out_file = tmp_path / "cf_collected.h5"
+    out_file.touch()
+    pattern = (tmp_path / "cf_*.h5").as_posix()
+    with pytest.raises(gapsFileNotFoundError) as exc_info:
+        collect(out_file, pattern, clobber=False)
+
+    assert "No files found matching collection pattern" in str(exc_info)
+    assert list(tmp_path.glob("*")) == [out_file]
+
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])
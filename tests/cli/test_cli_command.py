@@ -3,11 +3,17 @@
 GAPs CLI command configuration tests.
 """
 from pathlib import Path
+from dataclasses import dataclass
 
 import click
 import pytest
 
-from gaps.cli.command import CLICommandFromFunction, _WrappedCommand
+from gaps.cli.command import (
+    CLICommandFromFunction,
+    _WrappedCommand,
+    _passthrough,
+    _split_points_only,
+)
 from gaps.cli.config import GAPS_SUPPLIED_ARGS
 
 
@@ -25,6 +31,7 @@ def test_cli_command_configuration():
     assert not ccc.preprocessor_defaults
     assert len(ccc.documentation.signatures) == 2
     assert not ccc.is_split_spatially
+    assert ccc.config_preprocessor is _passthrough
     assert all(
         param in ccc.documentation.skip_params for param in GAPS_SUPPLIED_ARGS
     )
@@ -60,6 +67,102 @@ def test_cli_command_configuration():
     config_in = {"project_points": [0, 1]}
     assert ccc.config_preprocessor(config_in, name="test") == expected_out
 
+    with pytest.raises(KeyError):
+        ccc.config_preprocessor({"a": 1}, name="test")
+
+
+def test_cli_command_default_preprocessor_split():
+    """Test the spatial split with no user preprocessing function."""
+
+    def _test_func(project_points):
+        pass
+
+    ccc = CLICommandFromFunction(
+        _test_func, name="run", split_keys=["project_points"]
+    )
+    assert ccc.config_preprocessor is _split_points_only
+    assert ccc.preprocessor_args == {"config"}
+    assert not ccc.preprocessor_defaults
+
+    config_in = {"project_points": [0, 1]}
+    expected_out = {
+        "project_points": [0, 1],
+        "project_points_split_range": [(0, 2)],
+    }
+    assert ccc.config_preprocessor(config=config_in) == expected_out
+
+    with pytest.raises(KeyError):
+        ccc.config_preprocessor(config={"a": 1})
+
+
+def test_cli_command_sorted_split_keys():
+    """Test that split keys are sorted with point ranges last."""
+
+    def _test_func(project_points, b, a, c, d):
+        pass
+
+    ccc = CLICommandFromFunction(
+        _test_func,
+        name="run",
+        split_keys=["project_points", "b", ("c", "d"), "a"],
+    )
+    expected = ("a", "b", ("c", "d"), "project_points_split_range")
+    assert ccc.sorted_split_keys == expected
+    assert ccc.sorted_split_keys is ccc.sorted_split_keys
+
+
+def test_cli_command_preprocessor_signature_cached():
+    """Test that preprocessor signatures are only inspected once."""
+
+    def _test_func():
+        pass
+
+    def _test_preprocessor(config, name, _a_default=3):
+        return config
+
+    ccc1 = CLICommandFromFunction(
+        _test_func, name="run", config_preprocessor=_test_preprocessor
+    )
+    ccc2 = CLICommandFromFunction(
+        _test_func, name="run2", config_preprocessor=_test_preprocessor
+    )
+    assert "preprocessor_args" not in vars(ccc1)
+    assert "preprocessor_defaults" not in vars(ccc1)
+
+    assert ccc1.preprocessor_args is ccc2.preprocessor_args
+    assert ccc1.preprocessor_defaults == ccc2.preprocessor_defaults
+    assert ccc1.preprocessor_defaults is not ccc2.preprocessor_defaults
+    assert ccc1.documentation is ccc2.documentation
+
+    ccc3 = CLICommandFromFunction(
+        _test_func,
+        name="run3",
+        config_preprocessor=_test_preprocessor,
+        skip_doc_params=["name"],
+    )
+    assert ccc3.documentation is not ccc1.documentation
+
+
+def test_cli_command_unhashable_preprocessor():
+    """Test that unhashable callable preprocessors are supported."""
+
+    def _test_func():
+        pass
+
+    @dataclass
+    class _Preprocessor:
+        scale: int = 2
+
+        def __call__(self, config, name=None):
+            return config
+
+    ccc = CLICommandFromFunction(
+        _test_func, name="run", config_preprocessor=_Preprocessor()
+    )
+    assert ccc.preprocessor_args == {"config", "name"}
+    assert ccc.preprocessor_defaults == {"name": None}
+    assert ccc.documentation is not None
+
 
 def test_wrapped_command():
     """Test the `get_help` method of the wrapped command."""
@@ -79,5 +182,19 @@ def test_wrapped_command():
     assert ".\n\n" in command.get_help(click.Context(command))
 
 
+def test_wrapped_command_help_follows_context():
+    """Test that the help of a wrapped command follows context settings."""
+    command = _WrappedCommand("test", help="Some help text.")
+    help_text = command.get_help(click.Context(command))
+    assert "Some help text." in help_text
+    assert "--help" in help_text
+
+    ctx = click.Context(command, help_option_names=["-h"])
+    help_text = command.get_help(ctx)
+    assert "Some help text." in help_text
+    assert "-h" in help_text
+    assert "--help" not in help_text
+
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])
@@ -1213,6 +1213,12 @@ def test_as_script_str():
     )
     assert as_script_str(input_dict) == expected_string
 
+    input_dict = {"null": "true or false", "t": 'a "null" \\ b', "n": None}
+    expected_string = (
+        '{"null": "true or false", "t": "a \\"null\\" \\\\ b", "n": None}'
+    )
+    assert as_script_str(input_dict) == expected_string
+
 
 @pytest.mark.parametrize(
     "points",
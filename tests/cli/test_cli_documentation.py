@@ -293,6 +293,28 @@ def test_command_documentation_required_args():
     assert not doc.required_args
 
 
+def test_command_documentation_required_config_keys():
+    """Test the cached required config keys and exec params."""
+
+    def func(input1, input2, max_workers, input3=None):
+        """Test func."""
+
+    doc = CommandDocumentation(func, skip_params={"input2"})
+    assert doc.required_config_keys == {"input1"}
+    assert doc.required_exec_params == {"max_workers"}
+    assert doc.required_config_keys is doc.required_config_keys
+
+    expected_keys = {
+        "input1",
+        "input2",
+        "max_workers",
+        "input3",
+        "execution_control",
+        "project_points_split_range",
+    }
+    assert doc.allowed_config_keys == expected_keys
+
+
 def test_command_documentation_template_config():
     """Test `CommandDocumentation.template_config`."""
 
@@ -332,6 +354,32 @@ def test_command_documentation_template_config():
     assert doc.template_config == expected_config
 
 
+def test_command_documentation_help_is_cached():
+    """Test that help strings are built once but configs are fresh."""
+
+    def func(project_points, a, b=1):
+        """Test func.
+
+        Parameters
+        ----------
+        project_points : int
+            Points.
+        a : int
+            A.
+        b : int, optional
+            B. By default, ``1``.
+        """
+
+    doc = CommandDocumentation(func)
+    assert doc.hpc_parameter_help is doc.hpc_parameter_help
+    assert doc.parameter_help is doc.parameter_help
+    assert doc.exec_control_doc is doc.exec_control_doc
+
+    template_config = doc.template_config
+    template_config["execution_control"]["option"] = "eagle"
+    assert doc.template_config["execution_control"]["option"] == "local"
+
+
 def test_command_documentation_parameter_help():
     """Test `CommandDocumentation.parameter_help`."""
 
@@ -162,8 +162,10 @@ def test_kickoff_job_hpc(
     assert not cmd_cache
     assert not list(test_ctx.obj["TMP_PATH"].glob("*"))
 
+    exec_kwargs_in = dict(exec_kwargs)
     kickoff_job(test_ctx, cmd, exec_kwargs)
     test_ctx.obj.pop("MANAGER", None)
+    assert exec_kwargs == exec_kwargs_in
 
     assert len(cmd_cache) >= 1, str(cmd_cache)
     assert_message_was_logged(
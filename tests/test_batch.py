@@ -20,8 +20,11 @@ from gaps.batch import (
     _check_pipeline,
     _check_sets,
     _clean_arg,
+    _contents_match,
+    _copy_batch_file,
     _enumerated_product,
     _load_batch_config,
+    _mod_file,
     _parse_config,
     _source_needs_copying,
     _validate_batch_table,
@@ -33,6 +36,11 @@ from gaps.config import ConfigType
 from gaps.exceptions import gapsValueError, gapsConfigError
 
 
+def _raise_on_copy(*__, **___):
+    """Stand-in for file copy that should never be called."""
+    raise AssertionError("File should not have been copied!")
+
+
 @pytest.fixture
 def typical_batch_config(test_data_dir, tmp_path, request):
     """All batch configs to be used in tests"""
@@ -105,6 +113,69 @@ def test_source_needs_copying(tmp_path):
     assert _source_needs_copying(test_source_file, test_destination_file)
 
 
+def test_contents_match(tmp_path, monkeypatch):
+    """Test the `_contents_match` function."""
+    test_source_file = tmp_path / "test.txt"
+    test_destination_file = tmp_path / "test_copy.txt"
+
+    test_source_file.write_text("test")
+    assert not _contents_match(test_source_file, test_destination_file)
+
+    test_destination_file.write_text("new test")
+    with monkeypatch.context() as m:
+        m.setattr(gaps.batch.filecmp, "cmp", _raise_on_copy)
+        assert not _contents_match(test_source_file, test_destination_file)
+
+    test_destination_file.write_text("tess")
+    assert not _contents_match(test_source_file, test_destination_file)
+
+    test_destination_file.write_text("test")
+    assert _contents_match(test_source_file, test_destination_file)
+
+
+def test_copy_batch_file_skips_identical_contents(tmp_path, monkeypatch):
+    """Test that `_copy_batch_file` does not rewrite identical files."""
+    test_source_file = tmp_path / "test.txt"
+    test_destination_file = tmp_path / "test_copy.txt"
+
+    test_source_file.write_text("test")
+    _copy_batch_file(test_source_file, test_destination_file)
+    assert test_destination_file.read_text() == "test"
+
+    time.sleep(1)
+    test_source_file.write_text("test")
+    assert _source_needs_copying(test_source_file, test_destination_file)
+
+    with monkeypatch.context() as m:
+        m.setattr(gaps.batch.shutil, "copyfile", _raise_on_copy)
+        _copy_batch_file(test_source_file, test_destination_file)
+
+    assert not _source_needs_copying(test_source_file, test_destination_file)
+
+    time.sleep(1)
+    test_source_file.write_text("new test")
+    _copy_batch_file(test_source_file, test_destination_file)
+    assert test_destination_file.read_text() == "new test"
+
+
+def test_mod_file(tmp_path):
+    """Test `_mod_file` with and without matching keys."""
+    fp_in = tmp_path / "config.json"
+    fp_out = tmp_path / "config_out.json"
+    config_str = '{"a": 1, "b": {"c": [1, 2]}}'
+    fp_in.write_text(config_str)
+
+    _mod_file(fp_in, fp_out, {"d": 5})
+    assert fp_out.read_text() == config_str
+
+    _mod_file(fp_in, fp_out, {"c": "[3]"})
+    assert ConfigType.JSON.load(fp_out) == {"a": 1, "b": {"c": [3]}}
+
+    fp_in.write_text('{"a": 1, "\\u0064": 2}')
+    _mod_file(fp_in, fp_out, {"d": 5})
+    assert ConfigType.JSON.load(fp_out) == {"a": 1, "d": 5}
+
+
 def test_enumerated_product():
     """Test `_enumerated_product` function."""
 
@@ -80,6 +80,29 @@ def test_project_points_iter():
         assert np.allclose(site, pp.df.iloc[ind])
 
 
+def test_project_points_arrays():
+    """Test ProjectPoints column arrays."""
+    pp = ProjectPoints([1, 3, 5], lat=[10, 20, 30], lon=[-1.5, -2.5, -3.5])
+
+    lats, lons, gids = pp.arrays("lat", "lon", "gid")
+    assert isinstance(lats, np.ndarray)
+    assert np.allclose(lats, [10, 20, 30])
+    assert np.allclose(lons, [-1.5, -2.5, -3.5])
+    assert np.allclose(gids, [1, 3, 5])
+
+    lats, lons = pp.arrays("lat", "lon", dtype="float32")
+    assert lats.dtype == np.float32
+    assert lons.dtype == np.float32
+
+    arrays = pp.arrays()
+    assert len(arrays) == len(pp.df.columns)
+    for col, arr in zip(pp.df.columns, arrays):
+        assert np.array_equal(arr, pp.df[col].values)
+
+    with pytest.raises(gapsKeyError):
+        pp.arrays("lat", "dne")
+
+
 def test_project_points_get():
     """Test ProjectPoints get item."""
     pp = ProjectPoints([1, 3, 5])
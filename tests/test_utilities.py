@@ -13,6 +13,7 @@ from gaps.utilities import (
     recursively_update_dict,
     resolve_path,
     project_points_from_container_or_slice,
+    working_directory,
     _slice_to_list,
 )
 from gaps.exceptions import gapsValueError
@@ -168,5 +169,21 @@ def test_resolve_path():
     assert resolve_path("~/test_dir/../", base_dir) == Path.home().as_posix()
 
 
+def test_working_directory(tmp_path):
+    """Test the `working_directory` context manager."""
+    original_directory = Path.cwd()
+
+    with working_directory(tmp_path):
+        assert Path.cwd() == tmp_path.resolve()
+
+    assert Path.cwd() == original_directory
+
+    with pytest.raises(ValueError):
+        with working_directory(tmp_path):
+            raise ValueError("A test error")
+
+    assert Path.cwd() == original_directory
+
+
 if __name__ == "__main__":
     pytest.main(["-q", "--show-capture=all", Path(__file__), "-rapP"])